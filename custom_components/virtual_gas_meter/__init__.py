@@ -1,7 +1,6 @@
 """Virtual Gas Meter v3 integration."""
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime, timedelta
 import logging
 from typing import Any
@@ -10,12 +9,11 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    EVENT_HOMEASSISTANT_STOP,
     STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall, State, callback
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
@@ -38,17 +36,25 @@ from .const import (
     DEVICE_MANUFACTURER,
     DEVICE_MODEL,
     UPDATE_INTERVAL,
+    SAVE_DELAY,
     DECIMAL_PLACES,
-    SENSOR_VIRTUAL_GAS_METER_TOTAL,
-    SENSOR_CONSUMED_GAS,
     SENSOR_HEATING_INTERVAL,
     MINUTES_PER_HOUR,
+    SECONDS_PER_MINUTE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor"]
 
+SERVICE_REAL_METER_READING_UPDATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_METER_READING): cv.positive_float,
+        vol.Optional(ATTR_TIMESTAMP): cv.datetime,
+        vol.Optional(ATTR_RECALCULATE_AVERAGE_RATE, default=True): cv.boolean,
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Virtual Gas Meter from a config entry."""
@@ -69,13 +75,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         DOMAIN,
         SERVICE_REAL_METER_READING_UPDATE,
         handle_real_meter_reading_update,
-        schema=vol.Schema(
-            {
-                vol.Required(ATTR_METER_READING): cv.positive_float,
-                vol.Optional(ATTR_TIMESTAMP): cv.datetime,
-                vol.Optional(ATTR_RECALCULATE_AVERAGE_RATE, default=True): cv.boolean,
-            }
-        ),
+        schema=SERVICE_REAL_METER_READING_UPDATE_SCHEMA,
     )
     
     _LOGGER.info("Virtual Gas Meter v3 integration loaded")
@@ -114,18 +114,35 @@ class VirtualGasMeterCoordinator:
         self._unit = entry.data[CONF_UNIT]
         self._initial_meter_reading = entry.data[CONF_INITIAL_METER_READING]
         self._initial_average_rate = entry.data[CONF_INITIAL_AVERAGE_RATE]
+
+        # Boiler state decoder, chosen once for the entity's domain
+        self._decode_boiler_state = {
+            "climate": self._decode_climate_state,
+            "switch": self._decode_switch_state,
+            "binary_sensor": self._decode_switch_state,
+            "sensor": self._decode_sensor_state,
+        }.get(self._boiler_entity_id.partition(".")[0], self._decode_unsupported_state)
         
         # Runtime state
         self._last_real_meter_reading: float = self._initial_meter_reading
-        self._last_real_meter_timestamp: datetime = dt_util.now()
+        self._last_real_meter_timestamp: datetime = dt_util.utcnow()
+        self._last_real_meter_timestamp_iso: str = self._last_real_meter_timestamp.isoformat()
         self._average_rate_per_h: float = self._initial_average_rate
         self._consumed_gas: float = 0.0
-        self._heating_interval_minutes: int = 0
+        self._heating_interval_minutes: float = 0.0
         self._boiler_last_state: str | None = None
         self._boiler_state_change_time: datetime | None = None
+        self._last_tick_monotonic: float = 0.0
+        
+        # Rounded values read by the sensors, refreshed whenever state changes
+        self._refresh_display_values()
+        
+        # Bumped whenever the real reading, its timestamp or the rate change
+        self._reading_version: int = 0
         
         # Sensor references
         self._sensors: dict[str, Any] = {}
+        self._sensor_tuple: tuple[Any, ...] = ()
         
         # Listeners
         self._unsub_boiler_listener = None
@@ -151,31 +168,46 @@ class VirtualGasMeterCoordinator:
             self._handle_boiler_state_change,
         )
         
-        # Start interval update (60 seconds)
-        self._unsub_interval_listener = async_track_time_interval(
-            self.hass,
-            self._handle_interval_update,
-            timedelta(seconds=UPDATE_INTERVAL),
-        )
-        
         # Initialize boiler state
         state = self.hass.states.get(self._boiler_entity_id)
         if state:
-            self._boiler_last_state = self._get_boiler_state(state.state)
-            self._boiler_state_change_time = dt_util.now()
+            self._boiler_last_state = self._decode_boiler_state(state)
+            self._boiler_state_change_time = dt_util.utcnow()
+            self._last_tick_monotonic = self.hass.loop.time()
+        
+        # Start interval update only if the boiler is already running
+        if self._boiler_last_state == "on":
+            self._start_interval_listener()
 
     async def async_unload(self) -> None:
         """Unload the coordinator."""
         if self._unsub_boiler_listener:
             self._unsub_boiler_listener()
-        if self._unsub_interval_listener:
-            self._unsub_interval_listener()
+        self._stop_interval_listener()
         
         await self._save_data()
 
+    @callback
+    def _start_interval_listener(self) -> None:
+        """Start the runtime tick interval (60 seconds)."""
+        if self._unsub_interval_listener is None:
+            self._unsub_interval_listener = async_track_time_interval(
+                self.hass,
+                self._handle_interval_update,
+                timedelta(seconds=UPDATE_INTERVAL),
+            )
+
+    @callback
+    def _stop_interval_listener(self) -> None:
+        """Stop the runtime tick interval."""
+        if self._unsub_interval_listener:
+            self._unsub_interval_listener()
+            self._unsub_interval_listener = None
+
     def register_sensor(self, sensor_type: str, sensor: Any) -> None:
         """Register a sensor."""
         self._sensors[sensor_type] = sensor
+        self._sensor_tuple = tuple(self._sensors.values())
 
     def get_boiler_entity_id(self) -> str:
         """Get boiler entity ID."""
@@ -183,54 +215,72 @@ class VirtualGasMeterCoordinator:
 
     def get_virtual_gas_meter_total(self) -> float:
         """Get virtual gas meter total."""
-        total = self._last_real_meter_reading + self._consumed_gas
-        return round(total, DECIMAL_PLACES)
+        return self._virtual_gas_meter_total
 
     def get_consumed_gas(self) -> float:
         """Get consumed gas."""
-        return round(self._consumed_gas, DECIMAL_PLACES)
+        return self._consumed_gas_rounded
 
     def get_last_real_meter_reading(self) -> float:
         """Get last real meter reading."""
-        return round(self._last_real_meter_reading, DECIMAL_PLACES)
+        return self._last_real_meter_reading_rounded
 
     def get_last_real_meter_timestamp(self) -> str:
         """Get last real meter timestamp."""
-        return self._last_real_meter_timestamp.isoformat()
+        return self._last_real_meter_timestamp_iso
 
     def get_average_rate_per_h(self) -> float:
         """Get average rate per hour."""
-        return round(self._average_rate_per_h, DECIMAL_PLACES)
+        return self._average_rate_per_h_rounded
+
+    def get_reading_version(self) -> int:
+        """Get the version of the real reading and average rate."""
+        return self._reading_version
 
     def get_heating_interval_string(self) -> str:
         """Get heating interval as string."""
-        hours = self._heating_interval_minutes // MINUTES_PER_HOUR
-        minutes = self._heating_interval_minutes % MINUTES_PER_HOUR
-        return f"{hours}h {minutes}m"
+        return self._heating_interval_string
 
-    def _get_boiler_state(self, state_str: str) -> str:
-        """Determine if boiler is on or off."""
-        if state_str in [STATE_UNAVAILABLE, STATE_UNKNOWN]:
-            return "off"
-        
-        # Handle different entity types
-        entity_domain = self._boiler_entity_id.split(".")[0]
+    @callback
+    def _refresh_display_values(self) -> None:
+        """Recompute the rounded values read by the sensors."""
+        self._virtual_gas_meter_total = round(
+            self._last_real_meter_reading + self._consumed_gas, DECIMAL_PLACES
+        )
+        self._consumed_gas_rounded = round(self._consumed_gas, DECIMAL_PLACES)
+        self._last_real_meter_reading_rounded = round(
+            self._last_real_meter_reading, DECIMAL_PLACES
+        )
+        self._average_rate_per_h_rounded = round(self._average_rate_per_h, DECIMAL_PLACES)
         
-        if entity_domain == "climate":
-            # For climate entities, check if hvac_action is heating
-            state_obj = self.hass.states.get(self._boiler_entity_id)
-            if state_obj and state_obj.attributes.get("hvac_action") == "heating":
-                return "on"
+        total_minutes = int(self._heating_interval_minutes)
+        hours = total_minutes // MINUTES_PER_HOUR
+        minutes = total_minutes % MINUTES_PER_HOUR
+        self._heating_interval_string = f"{hours}h {minutes}m"
+
+    @staticmethod
+    def _decode_climate_state(state: State) -> str:
+        """Climate entities are on while hvac_action is heating."""
+        if state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
             return "off"
-        elif entity_domain in ["switch", "binary_sensor"]:
-            return "on" if state_str == STATE_ON else "off"
-        elif entity_domain == "sensor":
-            # For sensor, treat numeric > 0 or "on" as on
-            try:
-                return "on" if float(state_str) > 0 else "off"
-            except (ValueError, TypeError):
-                return "on" if state_str.lower() == "on" else "off"
-        
+        return "on" if state.attributes.get("hvac_action") == "heating" else "off"
+
+    @staticmethod
+    def _decode_switch_state(state: State) -> str:
+        """Switch and binary_sensor entities are on when their state is on."""
+        return "on" if state.state == STATE_ON else "off"
+
+    @staticmethod
+    def _decode_sensor_state(state: State) -> str:
+        """Sensor entities are on when numeric > 0 or their state is "on"."""
+        try:
+            return "on" if float(state.state) > 0 else "off"
+        except (ValueError, TypeError):
+            return "on" if state.state.lower() == "on" else "off"
+
+    @staticmethod
+    def _decode_unsupported_state(state: State) -> str:
+        """Entities from any other domain are treated as off."""
         return "off"
 
     @callback
@@ -240,7 +290,12 @@ class VirtualGasMeterCoordinator:
         if not new_state:
             return
         
-        current_boiler_state = self._get_boiler_state(new_state.state)
+        current_boiler_state = self._decode_boiler_state(new_state)
+        
+        # Ignore updates that do not flip the boiler on/off, such as climate
+        # temperature or preset attribute changes
+        if current_boiler_state == self._boiler_last_state:
+            return
         
         _LOGGER.debug(
             "Boiler state change: %s -> %s",
@@ -248,51 +303,67 @@ class VirtualGasMeterCoordinator:
             current_boiler_state,
         )
         
-        # If turning off, perform final tick
-        if self._boiler_last_state == "on" and current_boiler_state == "off":
+        # If turning on, start measuring runtime from now
+        if self._boiler_last_state != "on" and current_boiler_state == "on":
+            self._last_tick_monotonic = self.hass.loop.time()
+            self._start_interval_listener()
+        # If turning off, perform final tick and stop ticking
+        elif self._boiler_last_state == "on" and current_boiler_state == "off":
             self._perform_tick()
+            self._stop_interval_listener()
         
         self._boiler_last_state = current_boiler_state
-        self._boiler_state_change_time = dt_util.now()
+        self._boiler_state_change_time = dt_util.utcnow()
 
     @callback
     def _handle_interval_update(self, now: datetime) -> None:
-        """Handle interval updates (every 60 seconds)."""
-        if self._boiler_last_state == "on":
-            self._perform_tick()
+        """Handle interval updates (every 60 seconds while the boiler is on)."""
+        self._perform_tick()
 
+    @callback
     def _perform_tick(self) -> None:
         """Perform a runtime tick."""
-        # Increment runtime by 1 minute
-        self._heating_interval_minutes += 1
+        # Increment runtime by the time elapsed since the last tick, so late
+        # timer callbacks do not under-count
+        now = self.hass.loop.time()
+        elapsed_minutes = (now - self._last_tick_monotonic) / SECONDS_PER_MINUTE
+        self._last_tick_monotonic = now
+        self._heating_interval_minutes += elapsed_minutes
         
         # Calculate consumption increment
-        consumed_increment = self._average_rate_per_h / MINUTES_PER_HOUR
+        consumed_increment = self._average_rate_per_h * elapsed_minutes / MINUTES_PER_HOUR
         self._consumed_gas += consumed_increment
+        self._refresh_display_values()
         
-        _LOGGER.debug(
-            "Runtime tick: interval=%s, consumed_increment=%.3f, total_consumed=%.3f, meter_total=%.3f",
-            self.get_heating_interval_string(),
-            consumed_increment,
-            self._consumed_gas,
-            self.get_virtual_gas_meter_total(),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Runtime tick: interval=%s, consumed_increment=%.3f, total_consumed=%.3f, meter_total=%.3f",
+                self.get_heating_interval_string(),
+                consumed_increment,
+                self._consumed_gas,
+                self.get_virtual_gas_meter_total(),
+            )
         
-        # Update sensors
-        self._update_sensors()
+        # Update sensors; with a zero rate only the heating interval changes
+        if consumed_increment:
+            self._update_sensors()
+        elif heating_interval_sensor := self._sensors.get(SENSOR_HEATING_INTERVAL):
+            heating_interval_sensor.async_write_ha_state()
         
-        # Save state
-        self.hass.async_create_task(self._save_data())
+        # Save state (coalesced with other ticks by the store)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
+    @callback
     def _update_sensors(self) -> None:
         """Update all sensors."""
-        for sensor in self._sensors.values():
-            sensor.async_schedule_update_ha_state(force_refresh=True)
+        for sensor in self._sensor_tuple:
+            sensor.async_write_ha_state()
 
     async def handle_real_meter_reading_update(self, call: ServiceCall) -> None:
         """Handle real meter reading update service call."""
         meter_reading = call.data[ATTR_METER_READING]
-        timestamp = call.data.get(ATTR_TIMESTAMP, dt_util.now())
+        timestamp = call.data.get(ATTR_TIMESTAMP)
+        timestamp = dt_util.as_utc(timestamp) if timestamp else dt_util.utcnow()
         recalculate = call.data.get(ATTR_RECALCULATE_AVERAGE_RATE, True)
         
         # Validation: meter_reading must be >= last_real
@@ -312,8 +383,9 @@ class VirtualGasMeterCoordinator:
         if runtime_minutes == 0:
             self._last_real_meter_reading = meter_reading
             self._last_real_meter_timestamp = timestamp
+            self._last_real_meter_timestamp_iso = timestamp.isoformat()
             self._consumed_gas = 0.0
-            self._heating_interval_minutes = 0
+            self._heating_interval_minutes = 0.0
             
             _LOGGER.info(
                 "Real meter reading update (runtime=0): reading=%.3f -> %.3f",
@@ -349,15 +421,27 @@ class VirtualGasMeterCoordinator:
             # Apply result
             self._last_real_meter_reading = meter_reading
             self._last_real_meter_timestamp = timestamp
+            self._last_real_meter_timestamp_iso = timestamp.isoformat()
             self._consumed_gas = 0.0
-            self._heating_interval_minutes = 0
+            self._heating_interval_minutes = 0.0
         
         # Update sensors
+        self._reading_version += 1
+        self._refresh_display_values()
         self._update_sensors()
         
         # Save state
         await self._save_data()
 
+    async def async_set_average_rate_per_h(self, average_rate: float) -> None:
+        """Set the average rate per hour and persist it."""
+        self._average_rate_per_h = average_rate
+        self._reading_version += 1
+        self._refresh_display_values()
+        self._update_sensors()
+        
+        await self._save_data()
+
     async def _load_data(self) -> None:
         """Load persisted data."""
         data = await self._store.async_load()
@@ -366,14 +450,17 @@ class VirtualGasMeterCoordinator:
             self._last_real_meter_reading = data.get(
                 "last_real_meter_reading", self._initial_meter_reading
             )
-            self._last_real_meter_timestamp = datetime.fromisoformat(
-                data.get("last_real_meter_timestamp", dt_util.now().isoformat())
+            self._last_real_meter_timestamp = (
+                dt_util.parse_datetime(data.get("last_real_meter_timestamp", ""))
+                or dt_util.utcnow()
             )
+            self._last_real_meter_timestamp_iso = self._last_real_meter_timestamp.isoformat()
             self._average_rate_per_h = data.get(
                 "average_rate_per_h", self._initial_average_rate
             )
             self._consumed_gas = data.get("consumed_gas", 0.0)
-            self._heating_interval_minutes = data.get("heating_interval_minutes", 0)
+            self._heating_interval_minutes = data.get("heating_interval_minutes", 0.0)
+            self._refresh_display_values()
             
             _LOGGER.debug(
                 "Loaded persisted data: last_reading=%.3f, consumed=%.3f, interval=%dm, rate=%.3f",
@@ -383,14 +470,17 @@ class VirtualGasMeterCoordinator:
                 self._average_rate_per_h,
             )
 
-    async def _save_data(self) -> None:
-        """Save data to storage."""
-        data = {
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to persist."""
+        return {
             "last_real_meter_reading": self._last_real_meter_reading,
-            "last_real_meter_timestamp": self._last_real_meter_timestamp.isoformat(),
+            "last_real_meter_timestamp": self._last_real_meter_timestamp_iso,
             "average_rate_per_h": self._average_rate_per_h,
             "consumed_gas": self._consumed_gas,
             "heating_interval_minutes": self._heating_interval_minutes,
         }
-        
-        await self._store.async_save(data)
+
+    async def _save_data(self) -> None:
+        """Save data to storage."""
+        await self._store.async_save(self._data_to_save())
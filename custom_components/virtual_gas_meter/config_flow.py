@@ -7,7 +7,6 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
 from homeassistant.helpers import selector
 import homeassistant.helpers.config_validation as cv
 
@@ -15,17 +14,43 @@ from .const import (
     DOMAIN,
     UNIT_M3,
     UNIT_CCF,
-    UNIT_OPTIONS,
     CONF_BOILER_ENTITY,
     CONF_UNIT,
     CONF_INITIAL_METER_READING,
     CONF_INITIAL_AVERAGE_RATE,
     CONF_AVERAGE_RATE,
     ALLOWED_BOILER_DOMAINS,
+    ALLOWED_BOILER_DOMAIN_SET,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Selectors shared by the setup and options forms
+_BOILER_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain=ALLOWED_BOILER_DOMAINS,
+    )
+)
+_UNIT_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value=UNIT_M3, label="Cubic Meters (m³)"),
+            selector.SelectOptionDict(value=UNIT_CCF, label="Hundred Cubic Feet (CCF)"),
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
+# Static setup schema, compiled once at import rather than per form render
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BOILER_ENTITY): _BOILER_SELECTOR,
+        vol.Required(CONF_UNIT, default=UNIT_M3): _UNIT_SELECTOR,
+        vol.Required(CONF_INITIAL_METER_READING, default=0.0): cv.positive_float,
+        vol.Required(CONF_INITIAL_AVERAGE_RATE, default=0.0): cv.positive_float,
+    }
+)
+
 
 class VirtualGasMeterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Virtual Gas Meter."""
@@ -50,9 +75,9 @@ class VirtualGasMeterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Validate boiler entity exists and is in allowed domains
             boiler_entity = user_input[CONF_BOILER_ENTITY]
-            domain = boiler_entity.split(".")[0] if "." in boiler_entity else ""
+            domain = boiler_entity.partition(".")[0]
             
-            if domain not in ALLOWED_BOILER_DOMAINS:
+            if domain not in ALLOWED_BOILER_DOMAIN_SET:
                 errors[CONF_BOILER_ENTITY] = "invalid_domain"
             elif not self.hass.states.get(boiler_entity):
                 errors[CONF_BOILER_ENTITY] = "entity_not_found"
@@ -65,31 +90,9 @@ class VirtualGasMeterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=user_input,
                 )
 
-        # Build the schema
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_BOILER_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=ALLOWED_BOILER_DOMAINS,
-                    )
-                ),
-                vol.Required(CONF_UNIT, default=UNIT_M3): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            selector.SelectOptionDict(value=UNIT_M3, label="Cubic Meters (m³)"),
-                            selector.SelectOptionDict(value=UNIT_CCF, label="Hundred Cubic Feet (CCF)"),
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Required(CONF_INITIAL_METER_READING, default=0.0): cv.positive_float,
-                vol.Required(CONF_INITIAL_AVERAGE_RATE, default=0.0): cv.positive_float,
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
             description_placeholders={
                 "unit_note": "Unit selection cannot be changed after setup."
@@ -114,37 +117,49 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         errors = {}
 
         if user_input is not None:
-            # Validate boiler entity exists and is in allowed domains
+            # Validate boiler entity exists and is in allowed domains; the
+            # stored entity was already validated when it was configured
             boiler_entity = user_input[CONF_BOILER_ENTITY]
-            domain = boiler_entity.split(".")[0] if "." in boiler_entity else ""
+            boiler_changed = boiler_entity != self.config_entry.data.get(CONF_BOILER_ENTITY)
             average_rate = user_input.get(CONF_AVERAGE_RATE)
             
-            if domain not in ALLOWED_BOILER_DOMAINS:
+            if boiler_changed and boiler_entity.partition(".")[0] not in ALLOWED_BOILER_DOMAIN_SET:
                 errors[CONF_BOILER_ENTITY] = "invalid_domain"
-            elif not self.hass.states.get(boiler_entity):
+            elif boiler_changed and not self.hass.states.get(boiler_entity):
                 errors[CONF_BOILER_ENTITY] = "entity_not_found"
             elif average_rate is not None and average_rate <= 0:
                 errors[CONF_AVERAGE_RATE] = "must_be_positive"
             else:
-                # Update the config entry data with the new boiler entity
-                # Preserve all other settings (unit, initial readings, etc.)
-                new_data = {**self.config_entry.data}
-                new_data[CONF_BOILER_ENTITY] = boiler_entity
-                
-                self.hass.config_entries.async_update_entry(
-                    self.config_entry,
-                    data=new_data,
+                coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
+                rate_changed = (
+                    average_rate is not None
+                    and average_rate != coordinator.get_average_rate_per_h()
                 )
                 
-                # Update the average rate in the coordinator's storage if changed
-                if average_rate is not None:
-                    coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
-                    coordinator._average_rate_per_h = average_rate
-                    await coordinator._save_data()
-                    _LOGGER.info("Updated average rate per hour to %.3f", average_rate)
+                if boiler_changed:
+                    # Update the config entry data with the new boiler entity
+                    # Preserve all other settings (unit, initial readings, etc.)
+                    new_data = {**self.config_entry.data}
+                    new_data[CONF_BOILER_ENTITY] = boiler_entity
+                    
+                    self.hass.config_entries.async_update_entry(
+                        self.config_entry,
+                        data=new_data,
+                    )
+                    
+                    # Update the average rate in the coordinator if changed; the
+                    # reload below persists it when the coordinator unloads
+                    if rate_changed:
+                        coordinator._average_rate_per_h = average_rate
+                    
+                    # Reload the integration to apply changes
+                    await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+                elif rate_changed:
+                    # A rate change alone is applied without a reload
+                    await coordinator.async_set_average_rate_per_h(average_rate)
                 
-                # Reload the integration to apply changes
-                await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+                if rate_changed:
+                    _LOGGER.info("Updated average rate per hour to %.3f", average_rate)
                 
                 return self.async_create_entry(title="", data={})
 
@@ -159,11 +174,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         # Build the schema with current values
         data_schema = vol.Schema(
             {
-                vol.Required(CONF_BOILER_ENTITY, default=current_boiler): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=ALLOWED_BOILER_DOMAINS,
-                    )
-                ),
+                vol.Required(CONF_BOILER_ENTITY, default=current_boiler): _BOILER_SELECTOR,
                 vol.Required(CONF_AVERAGE_RATE, default=current_average_rate): cv.positive_float,
             }
         )
@@ -36,14 +36,19 @@ DEVICE_NAME = "Virtual Gas Meter"
 DEVICE_MANUFACTURER = "Virtual Gas Meter"
 DEVICE_MODEL = "Gas Usage Estimator"
 
-# Allowed boiler entity domains
+# Allowed boiler entity domains (list for the entity selector, set for lookups)
 ALLOWED_BOILER_DOMAINS = ["switch", "climate", "binary_sensor", "sensor"]
+ALLOWED_BOILER_DOMAIN_SET = frozenset(ALLOWED_BOILER_DOMAINS)
 
 # Update interval (seconds)
 UPDATE_INTERVAL = 60
 
+# Delay before persisting runtime ticks (seconds)
+SAVE_DELAY = 30
+
 # Decimal places
 DECIMAL_PLACES = 3
 
 # Time constants
 MINUTES_PER_HOUR = 60
+SECONDS_PER_MINUTE = 60
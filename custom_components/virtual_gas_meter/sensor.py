@@ -1,7 +1,6 @@
 """Sensor platform for Virtual Gas Meter v3."""
 from __future__ import annotations
 
-from datetime import datetime
 import logging
 from typing import Any
 
@@ -29,6 +28,12 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Native unit of measurement for each configured unit
+_UNIT_MAP: dict[str, str] = {
+    UNIT_M3: UnitOfVolume.CUBIC_METERS,
+    UNIT_CCF: UnitOfVolume.CENTUM_CUBIC_FEET,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -53,6 +58,7 @@ class VGMGasMeterTotalSensor(RestoreEntity, SensorEntity):
     """Virtual Gas Meter Total sensor - primary energy dashboard source."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
     _attr_device_class = SensorDeviceClass.GAS
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_suggested_display_precision = DECIMAL_PLACES
@@ -61,20 +67,13 @@ class VGMGasMeterTotalSensor(RestoreEntity, SensorEntity):
         """Initialize the sensor."""
         self._coordinator = coordinator
         self._config_entry = config_entry
+        self._attr_device_info = coordinator.device_info
         self._unit = unit
         self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_VIRTUAL_GAS_METER_TOTAL}"
         self._attr_name = "Gas Meter Total"
-        
-        # Set unit of measurement
-        if unit == UNIT_M3:
-            self._attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
-        else:  # CCF
-            self._attr_native_unit_of_measurement = UnitOfVolume.CENTUM_CUBIC_FEET
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return self._coordinator.device_info
+        self._attributes: dict[str, Any] = {}
+        self._attributes_version = -1
+        self._attr_native_unit_of_measurement = _UNIT_MAP[unit]
 
     @property
     def native_value(self) -> float | None:
@@ -84,13 +83,18 @@ class VGMGasMeterTotalSensor(RestoreEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        return {
-            "last_real_meter_reading": self._coordinator.get_last_real_meter_reading(),
-            "last_real_meter_timestamp": self._coordinator.get_last_real_meter_timestamp(),
-            "average_rate_per_h": f"{self._coordinator._average_rate_per_h:.{DECIMAL_PLACES}f}",
-            "boiler_entity_id": self._coordinator.get_boiler_entity_id(),
-            "unit": self._unit,
-        }
+        # Only rebuild when a real meter reading has changed the values
+        version = self._coordinator.get_reading_version()
+        if version != self._attributes_version:
+            self._attributes = {
+                "last_real_meter_reading": self._coordinator.get_last_real_meter_reading(),
+                "last_real_meter_timestamp": self._coordinator.get_last_real_meter_timestamp(),
+                "average_rate_per_h": f"{self._coordinator._average_rate_per_h:.{DECIMAL_PLACES}f}",
+                "boiler_entity_id": self._coordinator.get_boiler_entity_id(),
+                "unit": self._unit,
+            }
+            self._attributes_version = version
+        return self._attributes
 
     async def async_added_to_hass(self) -> None:
         """Handle entity added to hass."""
@@ -102,6 +106,7 @@ class VGMConsumedGasSensor(RestoreEntity, SensorEntity):
     """Consumed Gas sensor - gas consumed since last real reading."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
     _attr_device_class = SensorDeviceClass.GAS
     _attr_state_class = SensorStateClass.TOTAL
     _attr_suggested_display_precision = DECIMAL_PLACES
@@ -110,20 +115,11 @@ class VGMConsumedGasSensor(RestoreEntity, SensorEntity):
         """Initialize the sensor."""
         self._coordinator = coordinator
         self._config_entry = config_entry
+        self._attr_device_info = coordinator.device_info
         self._unit = unit
         self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_CONSUMED_GAS}"
         self._attr_name = "Consumed Gas"
-        
-        # Set unit of measurement
-        if unit == UNIT_M3:
-            self._attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
-        else:  # CCF
-            self._attr_native_unit_of_measurement = UnitOfVolume.CENTUM_CUBIC_FEET
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return self._coordinator.device_info
+        self._attr_native_unit_of_measurement = _UNIT_MAP[unit]
 
     @property
     def native_value(self) -> float | None:
@@ -140,21 +136,18 @@ class VGMHeatingIntervalSensor(RestoreEntity, SensorEntity):
     """Heating Interval sensor - boiler runtime since last real reading."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
     _attr_icon = "mdi:clock-outline"
 
     def __init__(self, coordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         self._coordinator = coordinator
         self._config_entry = config_entry
+        self._attr_device_info = coordinator.device_info
         self._attr_unique_id = f"{config_entry.entry_id}_{SENSOR_HEATING_INTERVAL}"
         self._attr_name = "Heating Interval"
         self._attr_native_unit_of_measurement = None
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return self._coordinator.device_info
-
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""